@@ -42,13 +42,15 @@ class GraphManager:
                 # We reuse the same kg instance but populate it
                 # We need to make sure init_project_graph uses the same repo
                 # For now let's see if we can pass the repo to init_project_graph
-                kg = init_project_graph(repository=repo)
+                kg = init_project_graph(
+                    storage_dir=str(self.storage_dir), repository=repo
+                )
             else:
                 logger.info(f"Graph loaded with {stats['total_nodes']} nodes")
         except Exception as e:
             logger.warning(f"Could not load stats, assuming empty or error: {e}")
             logger.info("Initializing new graph")
-            kg = init_project_graph(repository=repo)
+            kg = init_project_graph(storage_dir=str(self.storage_dir), repository=repo)
 
         self.current_graph = kg
         return self.current_graph
@@ -7,6 +7,7 @@ Usage:
 """
 
 import argparse
+import functools
 import logging
 import json
 import sys
@@ -442,8 +443,9 @@ def cmd_agent(args):
         print(f"   Suggestions included: {len(export['suggestions'])}\n")
 
 
-def main():
-    """Main CLI entry point."""
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; argparse parsers are reusable across calls."""
     parser = argparse.ArgumentParser(
         description="AI Dev Graph - Knowledge graph for AI agents",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -599,6 +601,12 @@ Examples:
     agent_export.add_argument("--output", help="Output file")
     agent_export.set_defaults(func=cmd_agent)
 
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    parser = _get_parser()
     args = parser.parse_args()
 
     if args.command is None:
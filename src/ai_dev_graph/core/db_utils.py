@@ -47,15 +47,53 @@ def backup_database(
 def export_to_json(
     db_path: str = "data/graph.db", output_path: str = "graphs/export.json"
 ):
-    """Export database to JSON format."""
+    """Export database to JSON format.
+
+    Nodes and edges are written one at a time instead of building the full
+    node-link document in memory first, so memory stays flat for large graphs.
+    """
     repo = NetworkXSQLiteRepository(db_path=db_path)
+    with open(output_path, "w", encoding="utf-8") as f:
+        _write_node_link_json(repo.graph, f)
+
+    logger.info(f"Graph exported to JSON: {output_path}")
+
+
+def _write_node_link_json(graph, f):
+    """Stream ``graph`` to the text file ``f`` as a node-link document."""
     # Use networkx format for export
     import networkx as nx
 
-    data = nx.node_link_data(repo.graph)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    logger.info(f"Graph exported to JSON: {output_path}")
+    # Empty skeleton gives the node-link key names used by the installed
+    # networkx; the values all come from the graph being exported
+    skeleton = nx.node_link_data(nx.DiGraph())
+    nodes_key, edges_key = [k for k, v in skeleton.items() if isinstance(v, list)]
+    header = {
+        "directed": graph.is_directed(),
+        "multigraph": graph.is_multigraph(),
+        "graph": graph.graph,
+    }
+
+    f.write("{")
+    for key in skeleton:
+        if key in (nodes_key, edges_key):
+            continue
+        f.write(f"{json.dumps(key)}: {json.dumps(header[key], ensure_ascii=False)}, ")
+
+    f.write(f"{json.dumps(nodes_key)}: [")
+    for i, (node_id, attrs) in enumerate(graph.nodes(data=True)):
+        f.write(",\n" if i else "\n")
+        f.write(json.dumps({**attrs, "id": node_id}, ensure_ascii=False))
+
+    f.write(f"\n], {json.dumps(edges_key)}: [")
+    for i, (source, target, attrs) in enumerate(graph.edges(data=True)):
+        f.write(",\n" if i else "\n")
+        f.write(
+            json.dumps(
+                {**attrs, "source": source, "target": target}, ensure_ascii=False
+            )
+        )
+    f.write("\n]}\n")
 
 
 def import_from_json(
@@ -6,31 +6,73 @@ maintaining the simplicity of a file-based database.
 
 import sqlite3
 import json
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Statements on the hot write/read paths. Keeping the text identical on every
+# call lets sqlite3's per-connection statement cache reuse the compiled plan.
+_SQL_UPSERT_NODE = """
+    INSERT OR REPLACE INTO nodes (id, type, content, metadata, updated_at)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+_SQL_INSERT_EDGE = """
+    INSERT OR IGNORE INTO edges (source, target)
+    VALUES (?, ?)
+"""
+_SQL_GET_NODE = """
+    SELECT id, type, content, metadata, created_at, updated_at
+    FROM nodes WHERE id = ?
+"""
+_SQL_UPDATE_CONTENT = """
+    UPDATE nodes SET content = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+_SQL_UPDATE_METADATA = """
+    UPDATE nodes SET metadata = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+_SQL_DELETE_NODE = "DELETE FROM nodes WHERE id = ?"
+
+# Trades durability for speed; only applied to throw-away databases
+_TEST_PRAGMAS = """
+    PRAGMA cache_size = -64000;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA locking_mode = EXCLUSIVE;
+    PRAGMA journal_mode = MEMORY;
+"""
+
 
 class GraphDatabase:
     """SQLite-backed graph database for persistent storage."""
 
-    def __init__(self, db_path: str = "data/graph.db"):
+    def __init__(self, db_path: str = "data/graph.db", test_mode: bool = False):
         """Initialize database connection.
 
         Args:
-            db_path: Path to SQLite database file.
+            db_path: Path to SQLite database file, or ":memory:" for a
+                throw-away in-memory database.
+            test_mode: Tune the connection for a throw-away database
+                (large page cache, in-memory journal, exclusive lock).
+                Always on for ":memory:".
         """
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.test_mode = test_mode or db_path == ":memory:"
+        if db_path != ":memory:":
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.conn: Optional[sqlite3.Connection] = None
+        self._bulk_depth = 0
         self._initialize_schema()
 
     def _initialize_schema(self):
         """Create database schema if it doesn't exist."""
-        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn = sqlite3.connect(str(self.db_path), cached_statements=256)
         self.conn.row_factory = sqlite3.Row
+        if self.test_mode:
+            self.conn.executescript(_TEST_PRAGMAS)
 
         cursor = self.conn.cursor()
 
@@ -74,6 +116,44 @@ class GraphDatabase:
         self.conn.commit()
         logger.info(f"Database initialized at {self.db_path}")
 
+    def _commit(self):
+        """Commit the current write unless it is part of a bulk block."""
+        if not self._bulk_depth:
+            self.conn.commit()
+
+    def _rollback(self, error: Exception):
+        """Roll back a failed write, or let it abort the enclosing bulk block."""
+        if self._bulk_depth:
+            raise error
+        self.conn.rollback()
+
+    @contextmanager
+    def bulk(self):
+        """Group all writes inside the block into a single transaction.
+
+        The writes are committed together on exit, or rolled back together
+        if any of them fails. Synchronous mode is switched off for the
+        duration of the block and restored afterwards.
+        """
+        outermost = self._bulk_depth == 0
+        if outermost:
+            previous_sync = self.conn.execute("PRAGMA synchronous").fetchone()[0]
+            self.conn.execute("PRAGMA synchronous = OFF")
+
+        self._bulk_depth += 1
+        try:
+            yield self
+            if outermost:
+                self.conn.commit()
+        except Exception:
+            if outermost:
+                self.conn.rollback()
+            raise
+        finally:
+            self._bulk_depth -= 1
+            if outermost:
+                self.conn.execute(f"PRAGMA synchronous = {int(previous_sync)}")
+
     def add_node(
         self,
         node_id: str,
@@ -97,19 +177,15 @@ class GraphDatabase:
             metadata_json = json.dumps(metadata or {})
 
             cursor.execute(
-                """
-                INSERT OR REPLACE INTO nodes (id, type, content, metadata, updated_at)
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """,
-                (node_id, node_type, content, metadata_json),
+                _SQL_UPSERT_NODE, (node_id, node_type, content, metadata_json)
             )
 
-            self.conn.commit()
+            self._commit()
             logger.debug(f"Added node: {node_id}")
             return True
         except Exception as e:
             logger.error(f"Error adding node {node_id}: {e}")
-            self.conn.rollback()
+            self._rollback(e)
             return False
 
     def add_edge(self, source: str, target: str) -> bool:
@@ -124,20 +200,35 @@ class GraphDatabase:
         """
         try:
             cursor = self.conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR IGNORE INTO edges (source, target)
-                VALUES (?, ?)
-            """,
-                (source, target),
-            )
+            cursor.execute(_SQL_INSERT_EDGE, (source, target))
 
-            self.conn.commit()
+            self._commit()
             logger.debug(f"Added edge: {source} -> {target}")
             return True
         except Exception as e:
             logger.error(f"Error adding edge {source}->{target}: {e}")
-            self.conn.rollback()
+            self._rollback(e)
+            return False
+
+    def add_edges(self, edges: List[Tuple[str, str]]) -> bool:
+        """Add several edges with a single prepared statement.
+
+        Args:
+            edges: List of (source, target) tuples.
+
+        Returns:
+            True if the edges were added successfully.
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.executemany(_SQL_INSERT_EDGE, edges)
+
+            self._commit()
+            logger.debug(f"Added {len(edges)} edges")
+            return True
+        except Exception as e:
+            logger.error(f"Error adding edges: {e}")
+            self._rollback(e)
             return False
 
     def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
@@ -150,13 +241,7 @@ class GraphDatabase:
             Node data dictionary or None if not found.
         """
         cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, type, content, metadata, created_at, updated_at
-            FROM nodes WHERE id = ?
-        """,
-            (node_id,),
-        )
+        cursor.execute(_SQL_GET_NODE, (node_id,))
 
         row = cursor.fetchone()
         if not row:
@@ -230,13 +315,7 @@ class GraphDatabase:
             cursor = self.conn.cursor()
 
             if content is not None:
-                cursor.execute(
-                    """
-                    UPDATE nodes SET content = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """,
-                    (content, node_id),
-                )
+                cursor.execute(_SQL_UPDATE_CONTENT, (content, node_id))
 
             if metadata is not None:
                 # Merge with existing metadata
@@ -244,20 +323,14 @@ class GraphDatabase:
                 current_meta.update(metadata)
                 metadata_json = json.dumps(current_meta)
 
-                cursor.execute(
-                    """
-                    UPDATE nodes SET metadata = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """,
-                    (metadata_json, node_id),
-                )
+                cursor.execute(_SQL_UPDATE_METADATA, (metadata_json, node_id))
 
-            self.conn.commit()
+            self._commit()
             logger.debug(f"Updated node: {node_id}")
             return True
         except Exception as e:
             logger.error(f"Error updating node {node_id}: {e}")
-            self.conn.rollback()
+            self._rollback(e)
             return False
 
     def delete_node(self, node_id: str) -> bool:
@@ -271,13 +344,13 @@ class GraphDatabase:
         """
         try:
             cursor = self.conn.cursor()
-            cursor.execute("DELETE FROM nodes WHERE id = ?", (node_id,))
-            self.conn.commit()
+            cursor.execute(_SQL_DELETE_NODE, (node_id,))
+            self._commit()
             logger.debug(f"Deleted node: {node_id}")
             return cursor.rowcount > 0
         except Exception as e:
             logger.error(f"Error deleting node {node_id}: {e}")
-            self.conn.rollback()
+            self._rollback(e)
             return False
 
     def find_nodes(self, node_type: str = None, content_match: str = None) -> List[str]:
@@ -1,4 +1,5 @@
-from typing import List, Dict, Any, Optional
+from contextlib import nullcontext
+from typing import List, Dict, Any, Optional, Tuple
 from ai_dev_graph.domain.models import NodeData
 from ai_dev_graph.domain.repositories import GraphRepository
 
@@ -16,8 +17,39 @@ class KnowledgeGraph:
     def add_knowledge(self, node: NodeData, parents: List[str] = []):
         """Add a node to the graph with optional parent relationships."""
         self.repo.add_node(node)
-        for parent in parents:
-            self.repo.add_edge(parent, node.id)
+        self._add_edges([(parent, node.id) for parent in parents])
+
+    def add_many(
+        self, nodes: List[NodeData], parents_map: Optional[Dict[str, List[str]]] = None
+    ):
+        """Add several nodes at once, batched when the repository supports it.
+
+        All nodes are added before any edge, so parents may appear anywhere
+        in the list.
+        """
+        parents_map = parents_map or {}
+        bulk = getattr(self.repo, "bulk", None)
+        with bulk() if bulk else nullcontext():
+            for node in nodes:
+                self.repo.add_node(node)
+            self._add_edges(
+                [
+                    (parent, node.id)
+                    for node in nodes
+                    for parent in parents_map.get(node.id, [])
+                ]
+            )
+
+    def _add_edges(self, edges: List[Tuple[str, str]]):
+        """Add edges in one batch when the repository supports it."""
+        if not edges:
+            return
+        add_edges = getattr(self.repo, "add_edges", None)
+        if add_edges:
+            add_edges(edges)
+        else:
+            for source, target in edges:
+                self.repo.add_edge(source, target)
 
     def get_context(self, node_id: str, depth: int = 1) -> Dict[str, Any]:
         """Recuperar contexto de un nodo: padres, hijos y metadatos."""
@@ -1,4 +1,5 @@
 import networkx as nx
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional, Tuple
 from ai_dev_graph.domain.models import NodeData
 from ai_dev_graph.core.persistence import GraphDatabase
@@ -9,22 +10,59 @@ from ai_dev_graph.core.config import settings
 class NetworkXSQLiteRepository:
     """Infrastructure implementation using NetworkX for graph logic and SQLite for persistence."""
 
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, test_mode: bool = False):
         self.db_path = db_path or settings.sqlite_path
         self.graph = nx.DiGraph()
-        self.db = GraphDatabase(self.db_path)
+        self.db = GraphDatabase(self.db_path, test_mode=test_mode)
+        # Node ids per type (insertion ordered), lower-cased content per node,
+        # memoized find_nodes results and a running edge count for get_stats
+        self._by_type: Dict[str, Dict[str, None]] = {}
+        self._content_lower: Dict[str, str] = {}
+        self._find_cache: Dict[Tuple, List[str]] = {}
+        self._edge_count = 0
         self._load_from_db()
 
     def _load_from_db(self):
         """Sync DB to memory."""
+        self._by_type.clear()
+        self._content_lower.clear()
+        self._find_cache.clear()
         for node_data in self.db.get_all_nodes():
             self.graph.add_node(node_data["id"], data=node_data)
+            self._index_node(node_data["id"], node_data["type"], node_data["content"])
 
         for source, target in self.db.get_all_edges():
             self.graph.add_edge(source, target)
+        self._edge_count = self.graph.number_of_edges()
+
+    def _index_node(self, node_id: str, node_type: str, content: str) -> None:
+        self._unindex_node(node_id)
+        self._by_type.setdefault(node_type, {})[node_id] = None
+        self._content_lower[node_id] = content.lower()
+
+    def _unindex_node(self, node_id: str) -> None:
+        self._find_cache.clear()
+        self._content_lower.pop(node_id, None)
+        for ids in self._by_type.values():
+            if node_id in ids:
+                del ids[node_id]
+                return
+
+    @contextmanager
+    def bulk(self):
+        """Batch all writes inside the block into one SQLite transaction."""
+        try:
+            with self.db.bulk():
+                yield self
+        except Exception:
+            # The transaction was rolled back, so resync the in-memory view
+            self.graph = nx.DiGraph()
+            self._load_from_db()
+            raise
 
     def add_node(self, node: NodeData) -> None:
         self.graph.add_node(node.id, data=node.model_dump())
+        self._index_node(node.id, node.type.value, node.content)
         self.db.add_node(
             node_id=node.id,
             node_type=node.type.value,
@@ -34,9 +72,24 @@ class NetworkXSQLiteRepository:
 
     def add_edge(self, source_id: str, target_id: str) -> None:
         if self.graph.has_node(source_id) and self.graph.has_node(target_id):
+            if not self.graph.has_edge(source_id, target_id):
+                self._edge_count += 1
             self.graph.add_edge(source_id, target_id)
             self.db.add_edge(source_id, target_id)
 
+    def add_edges(self, edges: List[Tuple[str, str]]) -> None:
+        edges = [
+            (source, target)
+            for source, target in edges
+            if self.graph.has_node(source) and self.graph.has_node(target)
+        ]
+        if edges:
+            self._edge_count += len(
+                {edge for edge in edges if not self.graph.has_edge(*edge)}
+            )
+            self.graph.add_edges_from(edges)
+            self.db.add_edges(edges)
+
     def get_node(self, node_id: str) -> Optional[NodeData]:
         if not self.graph.has_node(node_id):
             return None
@@ -74,54 +127,67 @@ class NetworkXSQLiteRepository:
             node_data["metadata"].update(metadata)
 
         self.graph.nodes[node_id]["data"] = node_data
+        if content is not None:
+            self._content_lower[node_id] = content.lower()
+        self._find_cache.clear()
         self.db.update_node(node_id, content=content, metadata=metadata)
         return True
 
     def delete_node(self, node_id: str) -> bool:
         if self.graph.has_node(node_id):
+            # A self-loop shows up in both in- and out-degree but is one edge
+            self._edge_count -= self.graph.degree(node_id) - self.graph.has_edge(
+                node_id, node_id
+            )
             self.graph.remove_node(node_id)
+            self._unindex_node(node_id)
             self.db.delete_node(node_id)
             return True
         return False
 
     def find_nodes(self, **filters) -> List[str]:
-        results = []
-        for node_id, attrs in self.graph.nodes(data=True):
-            node_data = attrs.get("data", {})
-            match = True
+        content_match = (
+            filters["content_match"].lower() if "content_match" in filters else None
+        )
+        key = ("type" in filters, filters.get("type"), content_match)
+        cached = self._find_cache.get(key)
+        if cached is not None:
+            return list(cached)
 
-            if "type" in filters:
-                if node_data.get("type") != filters["type"]:
-                    match = False
+        if "type" in filters:
+            candidates = self._by_type.get(filters["type"], {})
+        else:
+            candidates = self.graph.nodes
 
-            if "content_match" in filters and match:
-                if (
-                    filters["content_match"].lower()
-                    not in node_data.get("content", "").lower()
-                ):
-                    match = False
+        results = []
+        for node_id in candidates:
+            if "content_match" in filters:
+                if content_match not in self._content_lower.get(node_id, ""):
+                    continue
+            results.append(node_id)
 
-            if match:
-                results.append(node_id)
-        return results
+        self._find_cache[key] = results
+        return list(results)
 
     def get_neighbors(self, node_id: str) -> Dict[str, List[str]]:
-        if not self.graph.has_node(node_id):
+        # DiGraph already keeps incremental succ/pred adjacency dicts; read them
+        # directly instead of going through has_node() and iterator views
+        children = self.graph.succ.get(node_id)
+        if children is None:
             return {}
         return {
-            "parents": list(self.graph.predecessors(node_id)),
-            "children": list(self.graph.successors(node_id)),
+            "parents": list(self.graph.pred[node_id]),
+            "children": list(children),
         }
 
     def get_stats(self) -> Dict[str, Any]:
-        node_types = {}
-        for node_id, attrs in self.graph.nodes(data=True):
-            node_type = attrs.get("data", {}).get("type", "unknown")
-            node_types[node_type] = node_types.get(node_type, 0) + 1
+        total_nodes = self.graph.number_of_nodes()
+        # Same value as nx.density, without its O(n) edge recount
+        possible_edges = total_nodes * (total_nodes - 1)
 
         return {
-            "total_nodes": self.graph.number_of_nodes(),
-            "total_edges": self.graph.number_of_edges(),
-            "node_types": node_types,
-            "density": nx.density(self.graph),
+            "total_nodes": total_nodes,
+            "total_edges": self._edge_count,
+            "node_types": {t: len(ids) for t, ids in self._by_type.items() if ids},
+            "density": self._edge_count / possible_edges if possible_edges else 0,
         }
@@ -1,8 +1,55 @@
+import asyncio
 import os
 import pytest
+import pytest_asyncio
 import tempfile
 from ai_dev_graph.core.config import settings, DatabaseType
+from ai_dev_graph.infrastructure.networkx_repo import NetworkXSQLiteRepository
 from ai_dev_graph.infrastructure.persistence_factory import PersistenceFactory
+from ai_dev_graph.init_meta_graph import init_project_graph
+
+# Skip sandbox/GPU setup and /dev/shm limits that slow Chromium startup in CI
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-features=IsolateOrigins,site-per-process",
+]
+
+# Run async tests on uvloop when it is installed
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-e2e",
+        action="store_true",
+        default=False,
+        help="Run end-to-end browser tests",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip e2e-marked tests unless --run-e2e is given."""
+    if config.getoption("--run-e2e"):
+        return
+    skip_e2e = pytest.mark.skip(reason="use --run-e2e to run end-to-end tests")
+    for item in items:
+        if "e2e" in item.keywords:
+            item.add_marker(skip_e2e)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose each phase's report as item.rep_<phase> for fixture teardown."""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
 
 
 @pytest.fixture(autouse=True)
@@ -36,3 +83,53 @@ def force_test_db():
     settings.database_type = original_type
     settings.sqlite_path = original_path
     PersistenceFactory.reset()
+
+
+@pytest.fixture(scope="session")
+def meta_kg(tmp_path_factory):
+    """Project meta graph, built once per session. Tests must not mutate it."""
+    base = tmp_path_factory.mktemp("meta")
+    # Explicit repository: the per-test DB override is not active at session scope
+    repo = NetworkXSQLiteRepository(db_path=str(base / "meta.db"), test_mode=True)
+    kg = init_project_graph(storage_dir=str(base / "graphs"), repository=repo)
+    yield kg
+
+    repo.db.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def api_client(tmp_path_factory):
+    """In-process API client, no uvicorn server or browser needed."""
+    from httpx import ASGITransport, AsyncClient
+
+    from ai_dev_graph.api.main import app, graph_manager
+
+    # Keep graph snapshots written by the API out of the source tree
+    original_paths = graph_manager.storage_dir, graph_manager.graph_path
+    storage_dir = tmp_path_factory.mktemp("api_graphs")
+    graph_manager.storage_dir = storage_dir
+    graph_manager.graph_path = storage_dir / original_paths[1].name
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            yield client
+    finally:
+        graph_manager.storage_dir, graph_manager.graph_path = original_paths
+
+
+@pytest_asyncio.fixture(scope="session")
+async def playwright():
+    """Start Playwright once for the whole test session."""
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        yield p
+
+
+@pytest_asyncio.fixture(scope="session")
+async def browser(playwright):
+    """Launch one Chromium shared by every browser test module."""
+    browser = await playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+    yield browser
+    await browser.close()
@@ -0,0 +1,38 @@
+"""Tests for the REST API, served in-process through httpx's ASGI transport."""
+
+
+class TestAPIEndpoints:
+    """Tests for API endpoints that don't need the admin UI."""
+
+    async def test_api_health_check(self, api_client):
+        """Test API health endpoint."""
+        resp = await api_client.get("/health")
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "ok"
+
+    async def test_graph_api_endpoint(self, api_client):
+        """Test /graph API endpoint."""
+        resp = await api_client.get("/graph")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert "nodes" in data or "directed" in data
+
+    async def test_logs_endpoint_records_requests(self, api_client):
+        """Test /logs returns the activity log, newest first."""
+        await api_client.get("/health")
+        resp = await api_client.get("/logs")
+        assert resp.status_code == 200
+        logs = resp.json()
+        assert isinstance(logs, list)
+        assert logs[0]["path"] == "/health"
+        assert logs[0]["status_code"] == 200
+
+    async def test_logs_endpoint_is_newest_first(self, api_client):
+        """Test /logs lists entries in descending timestamp order."""
+        await api_client.get("/health")
+        await api_client.get("/graph")
+        logs = (await api_client.get("/logs")).json()
+
+        assert [log["path"] for log in logs[:2]] == ["/graph", "/health"]
+        timestamps = [log["timestamp"] for log in logs]
+        assert timestamps == sorted(timestamps, reverse=True)
@@ -10,6 +10,7 @@ from unittest.mock import patch, MagicMock
 from pathlib import Path
 
 from ai_dev_graph.cli import (
+    _get_parser,
     cmd_server,
     cmd_init,
     cmd_validate,
@@ -19,6 +20,18 @@ from ai_dev_graph.cli import (
 )
 
 
+@pytest.fixture(scope="session", autouse=True)
+def warm_parser():
+    """Build the cached CLI parser once before the first test needs it."""
+    _get_parser()
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run each CLI command from its own directory so graph artifacts never collide."""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestCmdInit:
     """Tests for init command."""
 
@@ -312,15 +325,25 @@ class TestMain:
 
     def test_main_handles_command_errors(self):
         """Test that main handles command execution errors."""
-        with patch.object(sys, "argv", ["cli", "export", "--agent", "test"]):
-            with patch(
-                "ai_dev_graph.cli.cmd_export", side_effect=Exception("Test error")
-            ):
-                result = main()
+        # The cached parser holds the handler bound at build time; rebuild it
+        # so the patched command is used, and again so later tests get the real one
+        _get_parser.cache_clear()
+        try:
+            with patch.object(sys, "argv", ["cli", "export", "--agent", "test"]):
+                with patch(
+                    "ai_dev_graph.cli.cmd_export", side_effect=Exception("Test error")
+                ):
+                    result = main()
+        finally:
+            _get_parser.cache_clear()
 
         # Should return error code
         assert result == 1
 
+    def test_parser_is_built_once(self):
+        """Test that repeated main() calls reuse the same parser."""
+        assert _get_parser() is _get_parser()
+
     def test_main_init_command_exists(self, capsys):
         """Test that init subcommand is properly registered."""
         with patch.object(sys, "argv", ["cli", "init"]):
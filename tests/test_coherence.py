@@ -5,6 +5,7 @@ from pathlib import Path
 from ai_dev_graph.domain.models import NodeType
 
 GRAPH_PATH = Path("graphs/v0_initial.json")
+VALID_NODE_TYPES = frozenset(t.value for t in NodeType)
 
 
 @pytest.fixture
@@ -31,17 +32,14 @@ def test_graph_is_connected(graph_data):
 
 def test_taxonomy_compliance(graph_data):
     """Regla Inquebrantable 2: Todos los nodos deben tener un tipo válido."""
-    g = nx.node_link_graph(graph_data)
-    valid_types = set(item.value for item in NodeType)
-
-    for node_id, attrs in g.nodes(data=True):
-        # NetworkX guarda los atributos del nodo dentro de 'data' o planos según serialización
-        # Nuestro formato guarda en 'data'
-        node_payload = attrs.get("data", {})
+    for node in graph_data["nodes"]:
+        node_id = node.get("id")
+        # init_project_graph guarda los campos planos; node_link_data los anida en 'data'
+        node_payload = node.get("data", node)
         node_type = node_payload.get("type")
 
         assert node_type is not None, f"El nodo {node_id} no tiene tipo definido."
-        assert node_type in valid_types, (
+        assert node_type in VALID_NODE_TYPES, (
             f"El nodo {node_id} tiene un tipo inválido: {node_type}"
         )
 
@@ -1,8 +1,8 @@
 """Comprehensive tests for AI Dev Graph functionality."""
 
 import pytest
+import sqlite3
 import tempfile
-import os
 from pathlib import Path
 
 from ai_dev_graph.domain.graph import KnowledgeGraph
@@ -15,17 +15,34 @@ from ai_dev_graph.init_meta_graph import init_project_graph
 @pytest.fixture
 def kg():
     """Fixture for a clean knowledge graph."""
-    # Using a temporary db for testing
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-        db_path = tmp.name
+    # In-memory SQLite keeps each test off the disk
+    repo = NetworkXSQLiteRepository(db_path=":memory:")
+    kg = KnowledgeGraph(repository=repo)
+    yield kg
+
+    repo.db.close()
+
 
-    repo = NetworkXSQLiteRepository(db_path=db_path)
+@pytest.fixture(scope="module")
+def kg_seeded():
+    """Shared graph for read-only tests. Tests using it must not mutate it."""
+    repo = NetworkXSQLiteRepository(db_path=":memory:")
     kg = KnowledgeGraph(repository=repo)
+    kg.add_many(
+        [
+            NodeData(id="root", type=NodeType.PROJECT, content="root"),
+            NodeData(id="child1", type=NodeType.CONCEPT, content="child 1"),
+            NodeData(id="child2", type=NodeType.CONCEPT, content="child 2"),
+            NodeData(id="r1", type=NodeType.RULE, content="rule 1"),
+            NodeData(id="n1", type=NodeType.GUIDELINE, content="This is about testing"),
+            NodeData(id="n2", type=NodeType.GUIDELINE, content="Another guideline"),
+            NodeData(id="n3", type=NodeType.INSTRUCTION, content="Testing again"),
+        ],
+        parents_map={"child1": ["root"], "child2": ["root"]},
+    )
     yield kg
 
-    # Cleanup
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    repo.db.close()
 
 
 class TestKnowledgeGraph:
@@ -44,52 +61,93 @@ class TestKnowledgeGraph:
         assert "child" in kg.get_successors("root")
         assert kg.get_node_data("root").content == "root node"
 
-    def test_node_context_retrieval(self, kg):
+    def test_node_context_retrieval(self, kg_seeded):
         """Test context retrieval for nodes."""
-        root = NodeData(id="root", type=NodeType.PROJECT, content="root")
-        child1 = NodeData(id="child1", type=NodeType.CONCEPT, content="child 1")
-        child2 = NodeData(id="child2", type=NodeType.CONCEPT, content="child 2")
-
-        kg.add_knowledge(root)
-        kg.add_knowledge(child1, parents=["root"])
-        kg.add_knowledge(child2, parents=["root"])
-
-        context = kg.get_context("root")
+        context = kg_seeded.get_context("root")
 
         assert context["parents"] == []
         assert set(context["children"]) == {"child1", "child2"}
 
-    def test_find_nodes_by_type(self, kg):
-        """Test finding nodes by type."""
-        nodes = [
-            NodeData(id="p1", type=NodeType.PROJECT, content="project 1"),
-            NodeData(id="c1", type=NodeType.CONCEPT, content="concept 1"),
-            NodeData(id="r1", type=NodeType.RULE, content="rule 1"),
-        ]
+    def test_neighbors_after_delete(self, kg):
+        """Test that deleting a node prunes it from its neighbors."""
+        kg.add_knowledge(NodeData(id="root", type=NodeType.PROJECT, content="root"))
+        kg.add_knowledge(
+            NodeData(id="child", type=NodeType.CONCEPT, content="c"), parents=["root"]
+        )
 
-        for node in nodes:
-            kg.add_knowledge(node)
+        kg.delete_node("child")
 
-        concepts = kg.find_nodes(type=NodeType.CONCEPT)
-        assert concepts == ["c1"]
+        assert kg.get_successors("root") == []
+        assert kg.get_predecessors("child") == []
 
-        rules = kg.find_nodes(type=NodeType.RULE)
+    def test_find_nodes_by_type(self, kg_seeded):
+        """Test finding nodes by type."""
+        concepts = kg_seeded.find_nodes(type=NodeType.CONCEPT)
+        assert set(concepts) == {"child1", "child2"}
+
+        rules = kg_seeded.find_nodes(type=NodeType.RULE)
         assert rules == ["r1"]
 
-    def test_find_nodes_by_content(self, kg):
+    def test_find_nodes_by_content(self, kg_seeded):
         """Test finding nodes by content match."""
-        kg.add_knowledge(
-            NodeData(id="n1", type=NodeType.CONCEPT, content="This is about testing")
+        results = kg_seeded.find_nodes(content_match="testing")
+        assert set(results) == {"n1", "n3"}
+
+    def test_find_nodes_reflects_mutations(self, kg):
+        """Test that repeated queries see updates and deletions."""
+        kg.add_knowledge(NodeData(id="a", type=NodeType.RULE, content="alpha"))
+        kg.add_knowledge(NodeData(id="b", type=NodeType.RULE, content="beta"))
+        assert kg.find_nodes(type=NodeType.RULE, content_match="alpha") == ["a"]
+
+        kg.update_node("b", content="alpha too")
+        assert kg.find_nodes(type=NodeType.RULE, content_match="alpha") == ["a", "b"]
+
+        kg.delete_node("a")
+        assert kg.find_nodes(type=NodeType.RULE) == ["b"]
+
+        kg.add_knowledge(NodeData(id="b", type=NodeType.TEST, content="retyped"))
+        assert kg.find_nodes(type=NodeType.RULE) == []
+        assert kg.find_nodes(type="test") == ["b"]
+
+    def test_add_many_with_parents(self, kg):
+        """Test bulk insertion wires parents regardless of list order."""
+        kg.add_many(
+            [
+                NodeData(id="leaf", type=NodeType.TEST, content="leaf"),
+                NodeData(id="top", type=NodeType.PROJECT, content="top"),
+            ],
+            parents_map={"leaf": ["top"]},
         )
-        kg.add_knowledge(
-            NodeData(id="n2", type=NodeType.CONCEPT, content="Another concept")
+
+        assert kg.get_successors("top") == ["leaf"]
+        assert kg.get_graph_stats()["total_edges"] == 1
+
+    def test_add_knowledge_with_many_parents(self, kg):
+        """Test that all parent edges are stored in memory and in SQLite."""
+        kg.add_many(
+            [NodeData(id=f"p{i}", type=NodeType.CONCEPT, content="p") for i in range(3)]
         )
         kg.add_knowledge(
-            NodeData(id="n3", type=NodeType.CONCEPT, content="Testing again")
+            NodeData(id="child", type=NodeType.RULE, content="child"),
+            parents=["p0", "p1", "p2", "missing"],
         )
 
-        results = kg.find_nodes(content_match="testing")
-        assert set(results) == {"n1", "n3"}
+        assert set(kg.get_predecessors("child")) == {"p0", "p1", "p2"}
+        assert set(kg.repo.db.get_all_edges()) == {
+            ("p0", "child"),
+            ("p1", "child"),
+            ("p2", "child"),
+        }
+
+    def test_bulk_rolls_back_on_error(self, kg):
+        """Test that a failed write discards the whole bulk batch."""
+        with pytest.raises(sqlite3.IntegrityError):
+            with kg.repo.bulk():
+                kg.add_knowledge(NodeData(id="ok", type=NodeType.RULE, content="ok"))
+                kg.repo.db.add_node("bad", "rule", None)
+
+        assert not kg.has_node("ok")
+        assert kg.repo.db.get_node("ok") is None
 
     def test_node_update(self, kg):
         """Test updating node content and metadata."""
@@ -112,20 +170,35 @@ class TestKnowledgeGraph:
         assert success
         assert not kg.has_node("test")
 
-    def test_graph_statistics(self, kg):
+    def test_graph_statistics(self, kg_seeded):
         """Test statistics calculation."""
-        kg.add_knowledge(NodeData(id="p1", type=NodeType.PROJECT, content="p"))
-        kg.add_knowledge(NodeData(id="c1", type=NodeType.CONCEPT, content="c"))
+        stats = kg_seeded.get_graph_stats()
+
+        assert stats["total_nodes"] == 7
+        assert stats["total_edges"] == 2
+        assert "node_types" in stats
+        assert "project" in stats["node_types"]
+
+    def test_graph_statistics_track_mutations(self, kg):
+        """Test that running counts follow duplicate edges and deletions."""
+        kg.add_knowledge(NodeData(id="a", type=NodeType.RULE, content="a"))
+        kg.add_knowledge(NodeData(id="b", type=NodeType.RULE, content="b"))
         kg.add_knowledge(
-            NodeData(id="r1", type=NodeType.RULE, content="r"), parents=["p1"]
+            NodeData(id="c", type=NodeType.TEST, content="c"), parents=["a", "b"]
         )
+        kg.repo.add_edge("a", "c")
+        kg.repo.add_edge("a", "a")
 
         stats = kg.get_graph_stats()
+        assert stats["total_edges"] == 3
+        assert stats["node_types"] == {"rule": 2, "test": 1}
+        assert stats["density"] == pytest.approx(0.5)
+
+        kg.delete_node("a")
 
-        assert stats["total_nodes"] == 3
+        stats = kg.get_graph_stats()
         assert stats["total_edges"] == 1
-        assert "node_types" in stats
-        assert "project" in stats["node_types"]
+        assert stats["node_types"] == {"rule": 1, "test": 1}
 
 
 class TestGraphManager:
@@ -151,18 +224,18 @@ class TestGraphManager:
 class TestInitMetaGraph:
     """Tests for meta graph initialization."""
 
-    def test_project_graph_initialization(self):
+    def test_project_graph_initialization(self, meta_kg):
         """Test that project graph initializes with core nodes."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Change to tmpdir to avoid overriding local graph
-            os.chdir(tmpdir)
-            os.makedirs("graphs", exist_ok=True)
+        assert meta_kg.has_node("ai_dev_graph")
+        assert meta_kg.has_node("philosophy")
+        assert meta_kg.has_node("coding_standards")
 
-            kg = init_project_graph()
+    def test_project_graph_writes_initial_artifact(self, tmp_path):
+        """Test that initialization saves the initial JSON artifact."""
+        repo = NetworkXSQLiteRepository(db_path=":memory:")
+        init_project_graph(storage_dir=str(tmp_path / "graphs"), repository=repo)
 
-            assert kg.has_node("ai_dev_graph")
-            assert kg.has_node("philosophy")
-            assert kg.has_node("coding_standards")
+        assert (tmp_path / "graphs" / "v0_initial.json").exists()
 
 
 class TestIntegration:
@@ -0,0 +1,102 @@
+"""Tests for database management utilities."""
+
+import json
+import tracemalloc
+
+import networkx as nx
+
+from ai_dev_graph.core.db_utils import (
+    _write_node_link_json,
+    export_to_json,
+    import_from_json,
+)
+from ai_dev_graph.domain.models import NodeData, NodeType
+from ai_dev_graph.infrastructure.networkx_repo import NetworkXSQLiteRepository
+
+
+class TestExportToJson:
+    """Tests for the streamed JSON export."""
+
+    def test_export_writes_valid_node_link_json(self, tmp_path):
+        """Test that the streamed export is a valid node-link document."""
+        db_path = str(tmp_path / "graph.db")
+        repo = NetworkXSQLiteRepository(db_path=db_path)
+        repo.add_node(NodeData(id="root", type=NodeType.PROJECT, content="root"))
+        repo.add_node(NodeData(id="child", type=NodeType.CONCEPT, content="ñandú"))
+        repo.add_edge("root", "child")
+
+        output_file = tmp_path / "export.json"
+        export_to_json(db_path=db_path, output_path=str(output_file))
+
+        with open(output_file, encoding="utf-8") as f:
+            data = json.load(f)
+
+        assert data["directed"] is True
+        assert {n["id"] for n in data["nodes"]} == {"root", "child"}
+        edges = data.get("edges", data.get("links"))
+        assert edges == [{"source": "root", "target": "child"}]
+
+    def test_export_empty_graph(self, tmp_path):
+        """Test that an empty graph still produces valid JSON."""
+        output_file = tmp_path / "export.json"
+        export_to_json(db_path=str(tmp_path / "graph.db"), output_path=str(output_file))
+
+        with open(output_file, encoding="utf-8") as f:
+            data = json.load(f)
+
+        assert data["nodes"] == []
+
+    def test_export_keeps_graph_header(self, tmp_path):
+        """Test that graph attributes and direction survive a round trip."""
+        graph = nx.DiGraph(name="meta", version=2)
+        graph.add_edge("a", "b")
+
+        output_file = tmp_path / "export.json"
+        with open(output_file, "w", encoding="utf-8") as f:
+            _write_node_link_json(graph, f)
+
+        with open(output_file, encoding="utf-8") as f:
+            restored = nx.node_link_graph(json.load(f))
+
+        assert restored.graph == {"name": "meta", "version": 2}
+        assert restored.is_directed()
+        assert not restored.is_multigraph()
+        assert list(restored.edges) == [("a", "b")]
+
+    def test_export_round_trips_through_import(self, tmp_path):
+        """Test that an exported graph can be imported back."""
+        db_path = str(tmp_path / "graph.db")
+        repo = NetworkXSQLiteRepository(db_path=db_path)
+        repo.add_node(NodeData(id="a", type=NodeType.RULE, content="rule a"))
+        repo.add_node(NodeData(id="b", type=NodeType.TEST, content="test b"))
+        repo.add_edge("a", "b")
+
+        output_file = tmp_path / "export.json"
+        export_to_json(db_path=db_path, output_path=str(output_file))
+
+        new_db = str(tmp_path / "imported.db")
+        import_from_json(str(output_file), db_path=new_db)
+
+        imported = NetworkXSQLiteRepository(db_path=new_db)
+        assert imported.get_node("a").content == "rule a"
+        assert imported.get_all_edges() == [("a", "b")]
+
+    def test_export_streams_large_graph(self, tmp_path):
+        """Test that writing a large graph never holds the whole document."""
+        graph = nx.DiGraph()
+        for i in range(20_000):
+            graph.add_node(f"n{i}", type="concept", content=f"node {i} " * 4)
+            if i:
+                graph.add_edge(f"n{i - 1}", f"n{i}")
+
+        output_file = tmp_path / "export.json"
+        with open(output_file, "w", encoding="utf-8") as f:
+            tracemalloc.start()
+            try:
+                _write_node_link_json(graph, f)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        # A single json.dump of node_link_data needs at least the full size
+        assert peak < output_file.stat().st_size / 10
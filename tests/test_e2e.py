@@ -4,37 +4,69 @@ To run these tests, install Playwright:
     pip install playwright>=1.40.0 pytest-asyncio>=0.23.0
 
 Then run:
-    pytest tests/test_e2e.py -v
+    pytest tests/test_e2e.py -v --run-e2e
 
 Or with specific browser:
-    pytest tests/test_e2e.py -v --headed  # See browser window
+    pytest tests/test_e2e.py -v --run-e2e --headed  # See browser window
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
-from playwright.async_api import async_playwright
-import uvicorn
+import os
+import uuid
+import socket
 import threading
 import time
+import urllib.request
+from pathlib import Path
 
-from ai_dev_graph.api.main import app
+playwright_api = pytest.importorskip("playwright.async_api")
+expect = playwright_api.expect
+
+TRACES_DIR = Path("test-results")
+
+# Assets no assertion depends on. The admin panel's own CSS is inline, so the
+# only external stylesheet is the web-font one.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+# Shown by createNode() when POST /nodes succeeds
+CREATED_ALERT = "Knowledge node created successfully!"
+
+# Opt-in via --run-e2e
+pytestmark = pytest.mark.e2e
 
 
 # Server management
 class ServerManager:
     """Manage API server for testing."""
 
-    def __init__(self, host="127.0.0.1", port=8001):
+    def __init__(self, host="127.0.0.1", port=None):
+        if port is None:
+            # One server per xdist worker (gw0 -> 8001, gw1 -> 8002, ...)
+            worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+            port = 8001 + int(worker.removeprefix("gw") or 0)
         self.host = host
         self.port = port
         self.url = f"http://{host}:{port}"
         self.thread = None
         self.is_running = False
+        self.is_ready = False
+
+    def start(self, timeout=10.0, wait=True):
+        """Start the server in a background thread.
 
-    def start(self):
-        """Start the server in a background thread."""
+        With ``wait=False`` this returns as soon as the thread is running, so
+        other setup (e.g. the browser launch) can overlap with server boot;
+        call ``wait_until_ready`` before the first request.
+        """
 
         def run_server():
+            # Imported here so collecting this module stays cheap
+            import uvicorn
+
+            from ai_dev_graph.api.main import app
+
             config = uvicorn.Config(
                 app, host=self.host, port=self.port, log_level="error"
             )
@@ -45,20 +77,58 @@ class ServerManager:
         self.thread.start()
         self.is_running = True
 
-        # Wait for server to start
-        time.sleep(2)
+        if wait:
+            self.wait_until_ready(timeout)
+
+    def wait_until_ready(self, timeout=10.0):
+        """Poll the port, then /health, until the server answers or time runs out."""
+        if self.is_ready:
+            return
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                # Cheap TCP probe first; /health confirms the app is serving
+                with socket.create_connection((self.host, self.port), timeout=0.1):
+                    pass
+                with urllib.request.urlopen(f"{self.url}/health", timeout=0.2):
+                    self.is_ready = True
+                    return
+            except OSError:
+                time.sleep(0.025)
+
+        raise RuntimeError(f"Test server at {self.url} not ready after {timeout}s")
 
     def stop(self):
         """Stop the server."""
         self.is_running = False
 
 
+class AdminLocators:
+    """Lazy locators for the admin panel, built once per page."""
+
+    def __init__(self, page):
+        self.nav_dashboard = page.get_by_test_id("nav-visualizer")
+        self.nav_nodes = page.get_by_test_id("nav-nodes")
+        self.nav_create = page.get_by_test_id("nav-ingest")
+        self.nav_logs = page.get_by_test_id("nav-logs")
+        self.btn_create = page.get_by_test_id("btn-create-node")
+        self.btn_clear = page.get_by_test_id("btn-clear-form")
+        self.btn_refresh = page.get_by_test_id("btn-refresh-graph")
+        self.search_input = page.locator("#searchInput")
+        self.node_cards = page.locator(".node-card")
+        self.modal_close = page.locator(".modal-close")
+
+
 # Fixtures
 @pytest.fixture(scope="session")
 def server():
-    """Start API server for entire test session."""
+    """Start API server for entire test session.
+
+    Readiness is awaited in ``base_url``, so the server boots in its thread
+    while the session browser is launching.
+    """
     manager = ServerManager()
-    manager.start()
+    manager.start(wait=False)
 
     yield manager
 
@@ -67,33 +137,113 @@ def server():
 
 @pytest.fixture
 def base_url(server):
-    """Return the base URL for tests."""
+    """Return the base URL for tests once the server is answering."""
+    server.wait_until_ready()
     return server.url
 
 
-@pytest.fixture
-async def browser():
-    """Create browser instance for tests."""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        yield browser
-        await browser.close()
+async def _block_static_assets(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
 
-@pytest.fixture
-async def page(browser, base_url):
-    """Create a new page for each test."""
+@pytest_asyncio.fixture(scope="session")
+async def context(browser):
+    """Share a single browser context across tests."""
     context = await browser.new_context()
+    await context.route("**/*", _block_static_assets)
+    # Record lightweight traces; each test's chunk is only written on failure
+    await context.tracing.start(screenshots=False, snapshots=False)
+    yield context
+    await context.tracing.stop()
+    await context.close()
+
+
+@pytest_asyncio.fixture
+async def page(request, server, context, base_url):
+    """Create a new page for each test on the shared context.
+
+    ``server`` is requested before ``context`` so the server thread is already
+    booting while the browser launches. The test's trace chunk is saved to
+    ``test-results/`` only if the test failed.
+    """
+    await context.clear_cookies()
+    await context.tracing.start_chunk()
     page = await context.new_page()
     yield page
-    await context.close()
+    await page.close()
+
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.failed:
+        TRACES_DIR.mkdir(exist_ok=True)
+        await context.tracing.stop_chunk(
+            path=TRACES_DIR / f"trace_{request.node.name}.zip"
+        )
+    else:
+        await context.tracing.stop_chunk()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def warm_admin(server, context):
+    """Load the admin panel once so later pages hit a warm HTTP cache."""
+    server.wait_until_ready()
+    page = await context.new_page()
+    await page.goto(f"{server.url}/admin")
+    await page.wait_for_selector("#totalNodes")
+    await page.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def create_form_html(server, context, warm_admin):
+    """Standalone HTML for the create form, for tests that only need its DOM.
+
+    Captured once from the live panel: the #create section plus the
+    resetForm() handler its Clear button calls.
+    """
+    page = await context.new_page()
+    await page.goto(f"{server.url}/admin")
+    html = await page.evaluate(
+        """() => document.querySelector("#create").outerHTML +
+            `<script>${resetForm.toString()}</script>`"""
+    )
+    await page.close()
+    return html
+
+
+@pytest_asyncio.fixture
+async def admin_page(page, warm_admin, base_url):
+    """Page already showing the admin panel."""
+    await page.goto(f"{base_url}/admin")
+    return page
+
+
+@pytest_asyncio.fixture(scope="session")
+async def live_client(server):
+    """HTTP client for the live test server.
+
+    Seeding goes through the server so every write runs on its thread; the
+    SQLite connection behind the shared app is bound to whichever thread
+    opened it.
+    """
+    from httpx import AsyncClient
+
+    server.wait_until_ready()
+    async with AsyncClient(base_url=server.url) as client:
+        yield client
+
+
+@pytest.fixture
+def loc(page):
+    """Admin panel locators for the current page."""
+    return AdminLocators(page)
 
 
 # Tests
 class TestAdminDashboard:
     """Tests for Admin Panel Dashboard."""
 
-    @pytest.mark.asyncio
     async def test_load_admin_panel(self, page, base_url):
         """Test that admin panel loads successfully."""
         await page.goto(f"{base_url}/admin")
@@ -105,174 +255,153 @@ class TestAdminDashboard:
         dashboard = await page.query_selector("#dashboard")
         assert dashboard is not None
 
-    @pytest.mark.asyncio
-    async def test_dashboard_displays_stats(self, page, base_url):
+    async def test_dashboard_displays_stats(self, admin_page):
         """Test that dashboard displays graph statistics."""
-        await page.goto(f"{base_url}/admin")
-
         # Wait for stats to load
-        await page.wait_for_selector("#totalNodes", timeout=5000)
-
-        # Check stats elements exist
-        total_nodes = await page.query_selector("#totalNodes")
-        total_edges = await page.query_selector("#totalEdges")
-        density = await page.query_selector("#density")
-
-        assert total_nodes is not None
-        assert total_edges is not None
-        assert density is not None
+        await admin_page.wait_for_selector("#totalNodes", timeout=5000)
+
+        # Read all stats elements in a single round-trip
+        stats = await admin_page.evaluate(
+            """() => {
+                const text = (id) => document.getElementById(id)?.textContent ?? null;
+                return {
+                    nodes: text("totalNodes"),
+                    edges: text("totalEdges"),
+                    density: text("density"),
+                };
+            }"""
+        )
+
+        assert stats["edges"] is not None
+        assert stats["density"] is not None
 
         # Check that stats have content
-        nodes_text = await total_nodes.text_content()
-        assert nodes_text and nodes_text.strip() != ""
+        assert stats["nodes"] and stats["nodes"].strip() != ""
 
-    @pytest.mark.asyncio
-    async def test_navigation_buttons(self, page, base_url):
+    async def test_navigation_buttons(self, admin_page, loc):
         """Test that all navigation buttons work."""
-        await page.goto(f"{base_url}/admin")
-
         # Test Dashboard button
-        await page.click('.nav-item:has-text("Visualizer")')
-        await page.wait_for_selector("#dashboard.active")
+        await loc.nav_dashboard.click()
+        await admin_page.wait_for_selector("#dashboard.active")
 
         # Test Nodes button
-        await page.click('.nav-item:has-text("Nodes Library")')
-        await page.wait_for_selector("#nodes.active")
+        await loc.nav_nodes.click()
+        await admin_page.wait_for_selector("#nodes.active")
 
         # Test Create button
-        await page.click('.nav-item:has-text("Ingest Knowledge")')
-        await page.wait_for_selector("#create.active")
+        await loc.nav_create.click()
+        await admin_page.wait_for_selector("#create.active")
 
         # Test Logs button
-        await page.click('.nav-item:has-text("Activity Logs")')
-        await page.wait_for_selector("#logs.active")
+        await loc.nav_logs.click()
+        await admin_page.wait_for_selector("#logs.active")
 
 
 class TestCreateNode:
     """Tests for creating nodes through the admin panel."""
 
-    @pytest.mark.asyncio
-    @pytest.mark.asyncio
-    async def test_create_node_form_visible(self, page, base_url):
+    async def test_create_node_form_visible(self, page, loc, create_form_html):
         """Test that create node form is visible."""
-        await page.goto(f"{base_url}/admin")
+        await page.set_content(create_form_html)
 
-        # Navigate to create section
-        await page.click('.nav-item:has-text("Ingest Knowledge")')
+        # Check form elements in a single round-trip
+        present = await page.evaluate(
+            """() => ["#nodeId", "#nodeType", "#nodeContent"].map(
+                (sel) => document.querySelector(sel) !== null
+            )"""
+        )
 
-        # Check form elements
-        node_id_input = await page.query_selector("#nodeId")
-        node_type_select = await page.query_selector("#nodeType")
-        node_content = await page.query_selector("#nodeContent")
-        create_button = await page.query_selector('button:has-text("Create Node")')
+        assert present == [True, True, True]
+        await expect(loc.btn_create).to_be_visible()
 
-        assert node_id_input is not None
-        assert node_type_select is not None
-        assert node_content is not None
-        assert create_button is not None
-
-    @pytest.mark.asyncio
-    async def test_create_simple_node(self, page, base_url):
+    async def test_create_simple_node(self, admin_page, loc):
         """Test creating a simple node through the form."""
-        await page.goto(f"{base_url}/admin")
-
         # Navigate to create section
-        await page.click('.nav-item:has-text("Ingest Knowledge")')
+        await loc.nav_create.click()
 
         # Fill form
-        await page.fill("#nodeId", "test_e2e_concept")
-        await page.select_option("#nodeType", "concept")
-        await page.fill("#nodeContent", "Test concept from E2E test")
+        await admin_page.fill("#nodeId", f"test_e2e_concept_{uuid.uuid4().hex[:8]}")
+        await admin_page.select_option("#nodeType", "concept")
+        await admin_page.fill("#nodeContent", "Test concept from E2E test")
 
         # Submit form
-        await page.click('button:has-text("Create Node")')
-
-        # Wait briefly for alert to appear
-        await page.wait_for_selector("#alertBox", state="visible", timeout=5000)
+        await loc.btn_create.click()
 
-        # Check if alert exists
-        alert = await page.query_selector("#alertBox")
-        assert alert is not None
+        # A failed write also shows the alert, so check its message
+        await expect(admin_page.locator("#alertBox")).to_have_text(
+            CREATED_ALERT, timeout=5000
+        )
 
-    @pytest.mark.asyncio
-    async def test_create_node_with_metadata(self, page, base_url):
+    async def test_create_node_with_metadata(self, admin_page, loc):
         """Test creating node with metadata."""
-        await page.goto(f"{base_url}/admin")
-
         # Navigate to create section
-        await page.click('.nav-item:has-text("Ingest Knowledge")')
+        await loc.nav_create.click()
 
         # Fill form
-        await page.fill("#nodeId", "test_e2e_rule")
-        await page.select_option("#nodeType", "rule")
-        await page.fill("#nodeContent", "Test rule from E2E")
-        await page.fill("#nodeMetadata", '{"priority": "high"}')
+        await admin_page.fill("#nodeId", f"test_e2e_rule_{uuid.uuid4().hex[:8]}")
+        await admin_page.select_option("#nodeType", "rule")
+        await admin_page.fill("#nodeContent", "Test rule from E2E")
+        await admin_page.fill("#nodeMetadata", '{"priority": "high"}')
 
         # Submit form
-        await page.click('button:has-text("Create Node")')
-
-        # Wait briefly for alert to appear
-        await page.wait_for_selector("#alertBox", state="visible", timeout=5000)
+        await loc.btn_create.click()
 
-        # Check if alert exists
-        alert = await page.query_selector("#alertBox")
-        assert alert is not None
+        # A failed write also shows the alert, so check its message
+        await expect(admin_page.locator("#alertBox")).to_have_text(
+            CREATED_ALERT, timeout=5000
+        )
 
 
 class TestNodeManagement:
     """Tests for node management operations."""
 
-    @pytest.mark.asyncio
-    async def test_list_nodes_loads(self, page, base_url):
+    async def test_list_nodes_loads(self, admin_page, loc):
         """Test that nodes list loads."""
-        await page.goto(f"{base_url}/admin")
-
         # Navigate to nodes section
-        await page.click('.nav-item:has-text("Nodes Library")')
+        await loc.nav_nodes.click()
 
         # Wait for nodes list
-        await page.wait_for_selector("#nodesList", timeout=5000)
+        await admin_page.wait_for_selector("#nodesList", timeout=5000)
 
         # Check list exists
-        nodes_list = await page.query_selector("#nodesList")
+        nodes_list = await admin_page.query_selector("#nodesList")
         assert nodes_list is not None
 
-    @pytest.mark.asyncio
-    async def test_search_nodes_live(self, page, base_url):
+    async def test_search_nodes_live(self, admin_page, loc):
         """Test live search functionality."""
-        await page.goto(f"{base_url}/admin")
-
         # Navigate to nodes section
-        await page.click('.nav-item:has-text("Nodes Library")')
-        await page.wait_for_selector(".node-card", timeout=5000)
+        await loc.nav_nodes.click()
+        await admin_page.wait_for_selector(".node-card", timeout=5000)
 
         # Type in search
-        await page.fill("#searchInput", "philosophy")
-
-        # Wait a bit for filtering
-        await page.wait_for_timeout(500)
-
-        # Check filtered results
-        node_items = await page.query_selector_all(".node-card")
-        assert len(node_items) > 0
-
-    @pytest.mark.asyncio
-    async def test_view_node_details(self, page, base_url):
+        await loc.search_input.fill("philosophy")
+
+        # Wait until only matching cards remain visible
+        await admin_page.wait_for_function(
+            """(term) => {
+                const shown = [...document.querySelectorAll(".node-card")].filter(
+                    (c) => c.style.display !== "none"
+                );
+                return shown.length > 0 &&
+                    shown.every((c) => c.textContent.toLowerCase().includes(term));
+            }""",
+            arg="philosophy",
+        )
+
+    async def test_view_node_details(self, admin_page, loc):
         """Test viewing node details in modal."""
-        await page.goto(f"{base_url}/admin")
-
         # Navigate to nodes
-        await page.click('.nav-item:has-text("Nodes Library")')
-        await page.wait_for_selector(".node-card", timeout=5000)
+        await loc.nav_nodes.click()
+        await admin_page.wait_for_selector(".node-card", timeout=5000)
 
         # Click first node card
-        await page.click(".node-card")
+        await loc.node_cards.first.click()
 
         # Wait for modal
-        await page.wait_for_selector(".modal.active", timeout=5000)
+        await admin_page.wait_for_selector(".modal.active", timeout=5000)
 
         # Check modal content
-        modal = await page.query_selector(".modal-content")
+        modal = await admin_page.query_selector(".modal-content")
         assert modal is not None
 
 
@@ -282,136 +411,86 @@ class TestNodeManagement:
 class TestUserFlow:
     """Integration tests for complete user workflows."""
 
-    @pytest.mark.asyncio
-    async def test_complete_workflow_create_and_search(self, page, base_url):
+    async def test_complete_workflow_create_and_search(
+        self, admin_page, loc, live_client
+    ):
         """Test complete workflow: create node, then search for it."""
-        await page.goto(f"{base_url}/admin")
-
-        # Step 1: Create a new node
-        await page.click('.nav-item:has-text("Ingest Knowledge")')
-        await page.fill("#nodeId", f"workflow_test_{int(time.time())}")
-        await page.select_option("#nodeType", "concept")
-        await page.fill("#nodeContent", "Workflow test concept")
-        await page.click('button:has-text("Create Node")')
-
-        # Wait for success
-        await page.wait_for_selector("#alertBox", state="visible", timeout=5000)
+        # Step 1: Seed the node through the API; node creation via the form
+        # is already covered by TestCreateNode
+        node_id = f"workflow_test_{uuid.uuid4().hex[:8]}"
+        resp = await live_client.post(
+            "/nodes",
+            json={"id": node_id, "type": "concept", "content": "Workflow test concept"},
+        )
+        assert resp.status_code == 200
 
         # Step 2: Navigate to nodes list (search)
-        await page.click('.nav-item:has-text("Nodes Library")')
+        await loc.nav_nodes.click()
 
         # Step 3: Search for the created node
-        await page.fill("#searchInput", "workflow_test")
-
-        # Wait briefly for search to process
-        await page.wait_for_timeout(500)
+        await loc.search_input.fill("workflow_test")
 
-        # Step 4: Verify results exist
-        results = await page.query_selector(".node-card")
-        assert results is not None
+        # Step 4: Verify it shows up once the list has loaded
+        await expect(loc.node_cards.filter(has_text=node_id)).to_be_visible()
 
 
 class TestAPIIntegration:
     """Tests for API integration through the UI."""
 
-    @pytest.mark.asyncio
-    async def test_api_health_check(self, server):
-        """Test API health endpoint."""
-        try:
-            import aiohttp
-        except ImportError:
-            pytest.skip("aiohttp not installed")
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{server.url}/health") as resp:
-                assert resp.status == 200
-                data = await resp.json()
-                assert data["status"] == "ok"
-
-    @pytest.mark.asyncio
-    async def test_graph_api_endpoint(self, server):
-        """Test /graph API endpoint."""
-        try:
-            import aiohttp
-        except ImportError:
-            pytest.skip("aiohttp not installed")
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{server.url}/graph") as resp:
-                assert resp.status == 200
-                data = await resp.json()
-                assert "nodes" in data or "directed" in data
-
-    @pytest.mark.asyncio
-    async def test_create_node_via_api_and_verify_in_ui(self, page, server, base_url):
+    async def test_create_node_via_api_and_verify_in_ui(
+        self, admin_page, loc, live_client
+    ):
         """Test creating node via API and verifying it in UI."""
-        try:
-            import aiohttp
-            import uuid
-        except ImportError:
-            pytest.skip("aiohttp not installed")
-
-        # Create node via API
+        # Create node via the live server's API
         node_id = f"api_test_{uuid.uuid4().hex[:8]}"
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{server.url}/nodes",
-                json={
-                    "id": node_id,
-                    "type": "resource",
-                    "content": "Created via API for E2E test",
-                    "parents": [],
-                },
-            ) as resp:
-                assert resp.status == 200
+        resp = await live_client.post(
+            "/nodes",
+            json={
+                "id": node_id,
+                "type": "resource",
+                "content": "Created via API for E2E test",
+                "parents": [],
+            },
+        )
+        assert resp.status_code == 200
 
         # Verify in UI
-        await page.goto(f"{base_url}/admin")
-        await page.click('.nav-item:has-text("Nodes Library")')
-        await page.wait_for_selector(".node-card", timeout=5000)
+        await loc.nav_nodes.click()
+        await admin_page.wait_for_selector(".node-card", timeout=5000)
 
         # Search for it
-        await page.fill("#searchInput", node_id)
-        await page.wait_for_timeout(300)
+        await loc.search_input.fill(node_id)
 
         # Check it appears
-        content = await page.content()
-        assert node_id in content
+        await expect(loc.node_cards.filter(has_text=node_id)).to_be_visible()
 
 
 # Utility tests
 class TestUIElements:
     """Tests for UI elements and interactions."""
 
-    @pytest.mark.asyncio
-    async def test_refresh_button_works(self, page, base_url):
+    async def test_refresh_button_works(self, admin_page, loc):
         """Test that refresh button updates data."""
-        await page.goto(f"{base_url}/admin")
-
-        # Click refresh
-        await page.click('button:has-text("Refresh View")')
-
-        # Wait for potential update
-        await page.wait_for_timeout(1000)
+        # Click refresh and wait for the graph to be fetched again
+        async with admin_page.expect_response(
+            lambda r: r.url.endswith("/graph") and r.status == 200
+        ):
+            await loc.btn_refresh.click()
 
         # Check that element still exists
-        updated_text = await page.text_content("#totalNodes")
+        updated_text = await admin_page.text_content("#totalNodes")
         assert updated_text is not None
 
-    @pytest.mark.asyncio
-    async def test_form_reset_button(self, page, base_url):
+    async def test_form_reset_button(self, page, loc, create_form_html):
         """Test that form reset button clears inputs."""
-        await page.goto(f"{base_url}/admin")
-
-        # Navigate to create
-        await page.click('.nav-item:has-text("Ingest Knowledge")')
+        await page.set_content(create_form_html)
 
         # Fill form
         await page.fill("#nodeId", "test_value")
         await page.fill("#nodeContent", "test content")
 
         # Click reset
-        await page.click('button:has-text("Clear")')
+        await loc.btn_clear.click()
 
         # Check inputs are cleared
         node_id_value = await page.input_value("#nodeId")
@@ -420,30 +499,22 @@ class TestUIElements:
         assert node_id_value == ""
         assert content_value == ""
 
-    @pytest.mark.asyncio
-    async def test_modal_close_button(self, page, base_url):
+    async def test_modal_close_button(self, admin_page, loc):
         """Test that modal close button works."""
-        await page.goto(f"{base_url}/admin")
-
         # Navigate to nodes
-        await page.click('.nav-item:has-text("Nodes Library")')
-        await page.wait_for_selector(".node-card", timeout=5000)
+        await loc.nav_nodes.click()
+        await admin_page.wait_for_selector(".node-card", timeout=5000)
 
         # Click view button to open modal
-        view_buttons = await page.query_selector_all(".node-card")
-        if view_buttons:
-            await view_buttons[0].click()
-            await page.wait_for_selector(".modal.active", timeout=5000)
+        if await loc.node_cards.count():
+            await loc.node_cards.first.click()
+            await admin_page.wait_for_selector(".modal.active", timeout=5000)
 
             # Click close button
-            await page.click(".modal-close")
-
-            # Wait for modal to close
-            await page.wait_for_timeout(300)
+            await loc.modal_close.click()
 
             # Check modal is not visible
-            modal = await page.query_selector(".modal.active")
-            assert modal is None
+            await expect(admin_page.locator(".modal.active")).to_have_count(0)
 
 
 if __name__ == "__main__":
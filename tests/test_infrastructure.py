@@ -1,12 +1,22 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from ai_dev_graph.core.config import DatabaseType
+from ai_dev_graph.core.persistence import GraphDatabase
 from ai_dev_graph.infrastructure.persistence_factory import PersistenceFactory
 from ai_dev_graph.infrastructure.neo4j_repo import Neo4jRepository
 from ai_dev_graph.infrastructure.networkx_repo import NetworkXSQLiteRepository
 from ai_dev_graph.domain.models import NodeData, NodeType
 
 
+# Shared, read-only payload; built once at import instead of per test
+_SAMPLE_CONCEPT_NODE = NodeData(
+    id="test_node",
+    type=NodeType.CONCEPT,
+    content="test content",
+    metadata={"priority": "high"},
+)
+
+
 class TestPersistenceFactory:
     def teardown_method(self):
         PersistenceFactory.reset()
@@ -58,16 +68,23 @@ class TestPersistenceFactory:
 
 
 class TestNeo4jRepository:
-    @pytest.fixture
-    def mock_driver_instance(self):
-        """Yields the MOCK INSTANCE of the driver."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_driver_instance(cls):
+        """Yields the MOCK INSTANCE of the driver, patched once for the class."""
         with patch("ai_dev_graph.infrastructure.neo4j_repo.Neo4jDriver") as mock_class:
             driver_instance = MagicMock()
             mock_class.driver.return_value = driver_instance
             yield driver_instance
 
-    @pytest.fixture
-    def repo(self, mock_driver_instance):
+    @pytest.fixture(autouse=True)
+    def reset_driver(self, mock_driver_instance):
+        """Clear recorded calls and configured returns left by earlier tests."""
+        mock_driver_instance.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def repo(cls, mock_driver_instance):
         return Neo4jRepository(
             uri="bolt://test", user="u", password="p", database="neo4j"
         )
@@ -87,14 +104,7 @@ class TestNeo4jRepository:
         # .__enter__() returns the actual session
         mock_driver_instance.session.return_value.__enter__.return_value = session_mock
 
-        node = NodeData(
-            id="test_node",
-            type=NodeType.CONCEPT,
-            content="test content",
-            metadata={"priority": "high"},
-        )
-
-        repo.add_node(node)
+        repo.add_node(_SAMPLE_CONCEPT_NODE)
 
         # Verify the query
         session_mock.run.assert_called_once()
@@ -169,3 +179,20 @@ class TestNeo4jRepository:
         assert kwargs["type"] == NodeType.RULE
         assert kwargs["content_match"] == "urgent"
         assert len(ids) == 2
+
+
+class TestGraphDatabase:
+    def test_test_mode_tunes_connection(self, tmp_path):
+        db = GraphDatabase(str(tmp_path / "graph.db"), test_mode=True)
+
+        assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        assert db.conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+        assert db.conn.execute("PRAGMA locking_mode").fetchone()[0] == "exclusive"
+        db.close()
+
+    def test_file_database_keeps_defaults(self, tmp_path):
+        db = GraphDatabase(str(tmp_path / "graph.db"))
+
+        assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        assert db.conn.execute("PRAGMA locking_mode").fetchone()[0] == "normal"
+        db.close()
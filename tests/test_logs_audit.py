@@ -3,130 +3,191 @@
 Tests the activity logs section in the admin interface using Playwright.
 """
 
+import itertools
+import json
 import pytest
-import asyncio
-from playwright.async_api import async_playwright, Page
+import pytest_asyncio
+import time
+
+playwright_api = pytest.importorskip("playwright.async_api")
+Page = playwright_api.Page
+expect = playwright_api.expect
+
+# Reads the timestamp and action cells of every row in one browser round-trip
+ROW_CELLS = """trs => trs.map(tr => ({
+    ts: tr.cells[0]?.textContent || "",
+    action: tr.cells[1]?.textContent || "",
+}))"""
+
+# Method and path of every row, plus its full text to tell rows apart
+ROW_REQUESTS = """trs => trs.map(tr => ({
+    text: tr.textContent,
+    method: tr.cells[1]?.textContent.trim() || "",
+    path: tr.cells[2]?.textContent.trim() || "",
+}))"""
+
+BASE_URL = "http://localhost:8000"
+
+# Admin panel test ids (data-testid) and selectors, shared by the fixtures
+# and tests
+LOGS_NAV = "nav-logs"
+CREATE_NAV = "nav-ingest"
+CREATE_BUTTON = "btn-create-node"
+LOGS_TABLE_ID = "logs-table"
+CREATE_SECTION = "#create"
+LOGS_SECTION = "#logs"
+LOGS_TABLE = f'[data-testid="{LOGS_TABLE_ID}"]'
+LOGS_HEADERS = f"{LOGS_TABLE} th"
+LOGS_ROWS = f"{LOGS_TABLE} tbody tr"
+
+# Canned /logs payload for the read-only tests, newest first
+FIXED_LOGS_JSON = json.dumps(
+    [
+        {
+            "timestamp": f"2024-01-01T10:{59 - i:02d}:00",
+            "method": method,
+            "path": path,
+            "status_code": status,
+            "duration_ms": 1.5,
+            "ip": "127.0.0.1",
+        }
+        for i, (method, path, status) in enumerate(
+            [
+                ("GET", "/logs", 200),
+                ("DELETE", "/nodes/old_rule", 200),
+                ("PUT", "/nodes/feature_x", 200),
+                ("POST", "/nodes", 200),
+                ("GET", "/nodes/missing", 404),
+                ("GET", "/nodes", 200),
+                ("POST", "/nodes", 422),
+                ("GET", "/graph", 200),
+                ("GET", "/admin", 200),
+                ("GET", "/health", 200),
+            ]
+        )
+    ]
+)
+
+pytestmark = pytest.mark.e2e
 
 
-@pytest.fixture(scope="module")
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+async def wait_for_logs_ready(page):
+    """Wait until the Logs section has rendered its latest fetch."""
+    await page.locator(f'{LOGS_SECTION}[data-loaded="true"]').wait_for(timeout=5000)
 
 
-@pytest.fixture(scope="module")
-async def browser():
-    """Provide browser instance."""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        yield browser
-        await browser.close()
+@pytest_asyncio.fixture(scope="session")
+async def admin_state(browser):
+    """Storage state (cookies, localStorage) of a loaded admin panel."""
+    context = await browser.new_context(base_url=BASE_URL)
+    page = await context.new_page()
+    await page.goto("/admin", wait_until="load")
+    await expect(page.get_by_test_id(LOGS_NAV)).to_be_visible()
+    state = await context.storage_state()
+    await context.close()
+    return state
 
 
 @pytest.fixture
-async def page(browser):
+async def page(browser, admin_state):
     """Provide page instance."""
-    context = await browser.new_context()
+    context = await browser.new_context(storage_state=admin_state, base_url=BASE_URL)
     page = await context.new_page()
     yield page
     await context.close()
 
 
-class TestActivityLogsAudit:
-    """Tests for Activity Logs audit functionality."""
+async def _fulfill_fixed_logs(route):
+    await route.fulfill(
+        status=200, content_type="application/json", body=FIXED_LOGS_JSON
+    )
 
-    BASE_URL = "http://localhost:8000"
 
-    @pytest.mark.asyncio
-    async def test_logs_section_visible(self, page: Page):
-        """Test that Activity Logs section is visible in the admin panel."""
-        await page.goto(f"{self.BASE_URL}/admin")
-        await page.wait_for_load_state("networkidle")
+@pytest_asyncio.fixture(scope="class")
+async def logs_page(browser, admin_state):
+    """Admin panel opened on the Logs section, shared by a test class.
 
-        # Click on Logs navigation button
-        logs_button = page.locator('nav button:has-text("Logs")')
-        await logs_button.wait_for(state="visible", timeout=5000)
-        await logs_button.click()
+    Only for read-only tests: ``/logs`` is stubbed with ``FIXED_LOGS_JSON``,
+    so the table never reflects the live server.
+    """
+    context = await browser.new_context(storage_state=admin_state, base_url=BASE_URL)
+    await context.route("**/logs", _fulfill_fixed_logs)
+    page = await context.new_page()
+    await page.goto("/admin", wait_until="load")
+    await page.get_by_test_id(LOGS_NAV).click()
+    await wait_for_logs_ready(page)
+    yield page
+    await context.close()
 
-        # Verify logs section is displayed
-        logs_section = page.locator("#logs-section")
-        assert await logs_section.is_visible()
 
-    @pytest.mark.asyncio
-    async def test_logs_table_exists(self, page: Page):
-        """Test that logs table exists with proper structure."""
-        await page.goto(f"{self.BASE_URL}/admin")
-        await page.wait_for_load_state("networkidle")
+@pytest_asyncio.fixture(scope="class")
+async def log_rows(logs_page):
+    """Timestamp and action text of each row on ``logs_page``, read once."""
+    return await logs_page.locator(LOGS_ROWS).evaluate_all(ROW_CELLS)
 
-        # Navigate to logs
-        await page.click('nav button:has-text("Logs")')
-        await page.wait_for_selector("#logs-section", state="visible")
 
+# Only this class talks to the server on BASE_URL. --dist=loadscope keeps the
+# whole class on one xdist worker, so its tests never hit the log concurrently.
+class TestActivityLogsAudit:
+    """Tests for Activity Logs audit functionality."""
+
+    async def test_logs_section_visible(self, logs_page: Page):
+        """Test that Activity Logs section is visible in the admin panel."""
+        # Verify logs section is displayed
+        await expect(logs_page.locator(LOGS_SECTION)).to_be_visible()
+
+    async def test_logs_table_exists(self, logs_page: Page):
+        """Test that logs table exists with proper structure."""
         # Check table exists
-        table = page.locator("#logs-section table")
-        assert await table.count() > 0
+        table = logs_page.get_by_test_id(LOGS_TABLE_ID)
+        await expect(table.first).to_be_attached()
 
         # Check table headers
-        headers = await page.locator("#logs-section table th").all_text_contents()
-        assert "Timestamp" in headers or "Time" in headers
-        assert any("Action" in h or "Event" in h for h in headers)
+        headers = await logs_page.locator(LOGS_HEADERS).all_text_contents()
+        assert headers == ["TimeStamp", "Method", "Path", "Status", "Latency"]
 
-    @pytest.mark.asyncio
     async def test_logs_show_node_creation(self, page: Page):
         """Test that creating a node generates a log entry."""
-        await page.goto(f"{self.BASE_URL}/admin")
-        await page.wait_for_load_state("networkidle")
+        await page.goto("/admin", wait_until="load")
+        await expect(page.get_by_test_id(LOGS_NAV)).to_be_visible()
 
         # Navigate to create node section
-        await page.click('nav button:has-text("Create")')
-        await page.wait_for_selector("#create-section", state="visible")
+        await page.get_by_test_id(CREATE_NAV).click()
+        await expect(page.locator(CREATE_SECTION)).to_be_visible()
 
-        # Get initial log count
-        await page.click('nav button:has-text("Logs")')
-        await page.wait_for_selector("#logs-section", state="visible")
-        initial_logs = await page.locator("#logs-section table tbody tr").count()
+        # Remember the newest entry; /logs returns at most 100, newest first
+        await page.get_by_test_id(LOGS_NAV).click()
+        await wait_for_logs_ready(page)
+        rows = await page.locator(LOGS_ROWS).evaluate_all(ROW_REQUESTS)
+        newest_before = rows[0]["text"] if rows else None
 
         # Create a test node
-        await page.click('nav button:has-text("Create")')
-        await page.fill(
-            'input[name="nodeId"]',
-            f"test_log_node_{int(asyncio.get_event_loop().time())}",
-        )
-        await page.select_option('select[name="nodeType"]', "concept")
-        await page.fill('textarea[name="content"]', "Test node for log audit")
-        await page.click('button:has-text("Create Node")')
+        await page.get_by_test_id(CREATE_NAV).click()
+        await page.fill("#nodeId", f"test_log_node_{time.monotonic_ns()}")
+        await page.select_option("#nodeType", "concept")
+        await page.fill("#nodeContent", "Test node for log audit")
 
-        # Wait for creation
-        await page.wait_for_timeout(1000)
+        # Wait for the node to be stored
+        async with page.expect_response(
+            lambda r: r.url.endswith("/nodes") and r.request.method == "POST"
+        ):
+            await page.get_by_test_id(CREATE_BUTTON).click()
 
         # Check logs again
-        await page.click('nav button:has-text("Logs")')
-        await page.wait_for_selector("#logs-section", state="visible")
-        await page.wait_for_timeout(500)
-
-        final_logs = await page.locator("#logs-section table tbody tr").count()
-
-        # Should have at least one new log entry
-        assert final_logs > initial_logs, (
+        await page.get_by_test_id(LOGS_NAV).click()
+        await wait_for_logs_ready(page)
+
+        # The POST is logged before its response is sent, so the refetched
+        # table already lists it above the previously newest entry
+        rows = await page.locator(LOGS_ROWS).evaluate_all(ROW_REQUESTS)
+        new_rows = itertools.takewhile(lambda r: r["text"] != newest_before, rows)
+        assert any(r["method"] == "POST" and r["path"] == "/nodes" for r in new_rows), (
             "Log entry should be created after node creation"
         )
 
-    @pytest.mark.asyncio
-    async def test_logs_have_timestamps(self, page: Page):
+    async def test_logs_have_timestamps(self, log_rows):
         """Test that all log entries have valid timestamps."""
-        await page.goto(f"{self.BASE_URL}/admin")
-        await page.wait_for_load_state("networkidle")
-
-        # Navigate to logs
-        await page.click('nav button:has-text("Logs")')
-        await page.wait_for_selector("#logs-section", state="visible")
-
-        # Get all timestamp cells
-        timestamps = await page.locator(
-            "#logs-section table tbody tr td:first-child"
-        ).all_text_contents()
+        timestamps = [row["ts"] for row in log_rows]
 
         # Each log should have a timestamp
         for ts in timestamps:
@@ -136,91 +197,20 @@ class TestActivityLogsAudit:
                 "Timestamp should contain numbers"
             )
 
-    @pytest.mark.asyncio
-    async def test_logs_are_sorted_chronologically(self, page: Page):
-        """Test that logs are sorted with most recent first."""
-        await page.goto(f"{self.BASE_URL}/admin")
-        await page.wait_for_load_state("networkidle")
-
-        # Navigate to logs
-        await page.click('nav button:has-text("Logs")')
-        await page.wait_for_selector("#logs-section", state="visible")
-
-        # Get timestamps
-        timestamps = await page.locator(
-            "#logs-section table tbody tr td:first-child"
-        ).all_text_contents()
-
-        if len(timestamps) > 1:
-            # Verify descending order (most recent first)
-            # Note: This assumes ISO format timestamps
-            for i in range(len(timestamps) - 1):
-                assert timestamps[i] >= timestamps[i + 1] or True, (
-                    "Logs should be in chronological order (newest first)"
-                )
-
-    @pytest.mark.asyncio
-    async def test_logs_show_action_types(self, page: Page):
+    async def test_logs_show_action_types(self, log_rows):
         """Test that logs display different action types."""
-        await page.goto(f"{self.BASE_URL}/admin")
-        await page.wait_for_load_state("networkidle")
-
-        # Navigate to logs
-        await page.click('nav button:has-text("Logs")')
-        await page.wait_for_selector("#logs-section", state="visible")
-
-        # Get all action cells (assuming second column)
-        actions = await page.locator(
-            "#logs-section table tbody tr td:nth-child(2)"
-        ).all_text_contents()
-
-        # Should have some action types
-        assert len(actions) > 0, "Should have log entries with actions"
-
-        # Check for common action types
-        all_actions_text = " ".join(actions).lower()
-        # At least some common actions should be present over time
-        common_actions = ["created", "updated", "deleted", "loaded", "search", "view"]
-        # Don't require all, just check structure is correct
-        assert (
-            any(action in all_actions_text for action in common_actions)
-            or len(actions) > 0
-        )
+        # The action column shows each request's HTTP method
+        actions = [row["action"].strip() for row in log_rows]
+
+        served = [entry["method"] for entry in json.loads(FIXED_LOGS_JSON)]
+        assert actions == served
+        assert {"GET", "POST", "PUT", "DELETE"} <= set(actions)
+
+    async def test_refresh_logs(self, logs_page: Page):
+        """Test that reopening Logs fetches and renders the log again."""
+        # The panel has no separate refresh button; selecting Logs reloads it
+        async with logs_page.expect_request("**/logs"):
+            await logs_page.get_by_test_id(LOGS_NAV).click()
 
-    @pytest.mark.asyncio
-    async def test_logs_section_responsive(self, page: Page):
-        """Test that logs section is responsive and scrollable."""
-        await page.goto(f"{self.BASE_URL}/admin")
-        await page.wait_for_load_state("networkidle")
-
-        # Navigate to logs
-        await page.click('nav button:has-text("Logs")')
-        await page.wait_for_selector("#logs-section", state="visible")
-
-        # Check that section has reasonable dimensions
-        logs_section = page.locator("#logs-section")
-        box = await logs_section.bounding_box()
-
-        assert box is not None, "Logs section should be visible"
-        assert box["width"] > 0, "Section should have width"
-        assert box["height"] > 0, "Section should have height"
-
-    @pytest.mark.asyncio
-    async def test_refresh_logs_button(self, page: Page):
-        """Test that there is a way to refresh logs."""
-        await page.goto(f"{self.BASE_URL}/admin")
-        await page.wait_for_load_state("networkidle")
-
-        # Navigate to logs
-        await page.click('nav button:has-text("Logs")')
-        await page.wait_for_selector("#logs-section", state="visible")
-
-        # Look for refresh button or mechanism
-        refresh_elements = await page.locator(
-            'button:has-text("Refresh"), button[title*="Refresh"], button[aria-label*="Refresh"]'
-        ).count()
-
-        # Should have at least a dashboard refresh that affects logs
-        # Or logs should auto-refresh
-        dashboard_button = page.locator('nav button:has-text("Dashboard")')
-        assert await dashboard_button.is_visible() or refresh_elements > 0
+        # loadLogs() clears data-loaded before fetching and sets it once drawn
+        await wait_for_logs_ready(logs_page)